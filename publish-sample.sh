@@ -4,6 +4,32 @@ set -euo pipefail
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 
+# Builds are incremental by default: Sphinx keeps its pickled environment and
+# doctrees in the build directory and only rewrites documents whose source
+# changed. Sphinx does not notice changes to the builder itself, so a build
+# directory is removed and rebuilt from scratch whenever anything under src/
+# or pyproject.toml changed since it was last built. Pass --clean to always
+# rebuild from scratch, for example to see every warning again.
+#
+# A page is only uploaded if something which affects the upload changed since
+# the last upload from this build directory: its JSON, the upload arguments,
+# the sample source directory (which holds the local files that the page
+# embeds), the package source under src/ or pyproject.toml. Pass
+# --force-upload to upload anyway, for example after editing the page in
+# Notion.
+CLEAN=false
+FORCE_UPLOAD=false
+for arg in "$@"; do
+    case "${arg}" in
+    --clean) CLEAN=true ;;
+    --force-upload) FORCE_UPLOAD=true ;;
+    *)
+        echo "Unknown argument: ${arg}" >&2
+        exit 1
+        ;;
+    esac
+done
+
 set -a
 # The committed sample.env provides the Notion object IDs referenced by the
 # sample documentation; the gitignored .env provides the integration token.
@@ -13,20 +39,62 @@ source "${SCRIPT_DIR}/sample.env"
 source "${SCRIPT_DIR}/.env"
 set +a
 
-rm -rf "${SCRIPT_DIR}/build-sample"
-uv run --extra=sample sphinx-build -W -b notion "${SCRIPT_DIR}/sample" "${SCRIPT_DIR}/build-sample"
+code_digest() {
+    find "${SCRIPT_DIR}/src" "${SCRIPT_DIR}/pyproject.toml" \
+        -type f ! -name '*.pyc' -print0 |
+        LC_ALL=C sort -z |
+        xargs -0 shasum -a 256 |
+        shasum -a 256 |
+        cut -d ' ' -f 1
+}
+
+build_sample() {
+    local source_dir="$1"
+    local build_dir="$2"
+    local code_digest_file="${build_dir}/.last-built-code.sha256"
+    local digest
+    digest="$(code_digest)"
+    if [[ "${CLEAN}" == true || ! -f "${code_digest_file}" || "$(cat "${code_digest_file}")" != "${digest}" ]]; then
+        rm -rf "${build_dir}"
+    fi
+    uv run --extra=sample sphinx-build -W -b notion "${source_dir}" "${build_dir}"
+    echo "${digest}" > "${code_digest_file}"
+}
+
+upload_if_changed() {
+    local source_dir="$1"
+    local build_dir="$2"
+    shift 2
+    local digest_file="${build_dir}/.last-uploaded.sha256"
+    local digest
+    digest="$(
+        {
+            cat "${build_dir}/index.json"
+            printf '%s\n' "$@"
+            find "${source_dir}" "${SCRIPT_DIR}/src" "${SCRIPT_DIR}/pyproject.toml" \
+                -type f ! -name '*.pyc' -print0 |
+                LC_ALL=C sort -z |
+                xargs -0 shasum -a 256
+        } | shasum -a 256 | cut -d ' ' -f 1
+    )"
+    if [[ "${FORCE_UPLOAD}" == false && -f "${digest_file}" && "$(cat "${digest_file}")" == "${digest}" ]]; then
+        echo "No changes for ${build_dir}/index.json since the last upload, skipping upload (pass --force-upload to upload anyway)"
+        return
+    fi
+    uv run --all-extras notion-upload --file "${build_dir}/index.json" "$@"
+    echo "${digest}" > "${digest_file}"
+}
+
+build_sample "${SCRIPT_DIR}/sample" "${SCRIPT_DIR}/build-sample"
 
-uv run --all-extras notion-upload \
+upload_if_changed "${SCRIPT_DIR}/sample" "${SCRIPT_DIR}/build-sample" \
     --parent-database-id "$NOTION_SAMPLE_DATABASE_ID" \
-    --file "${SCRIPT_DIR}/build-sample/index.json" \
     --title "Test page title during testing" \
     --icon "🐍"
 
-rm -rf "${SCRIPT_DIR}/build-sample_warnings"
-uv run --extra=sample sphinx-build -W -b notion "${SCRIPT_DIR}/sample_warnings" "${SCRIPT_DIR}/build-sample_warnings"
+build_sample "${SCRIPT_DIR}/sample_warnings" "${SCRIPT_DIR}/build-sample_warnings"
 
-uv run --all-extras notion-upload \
+upload_if_changed "${SCRIPT_DIR}/sample_warnings" "${SCRIPT_DIR}/build-sample_warnings" \
     --parent-database-id "$NOTION_SAMPLE_DATABASE_ID" \
-    --file "${SCRIPT_DIR}/build-sample_warnings/index.json" \
     --title "Test suppressed warnings page title during testing" \
     --icon "🐍"
@@ -109,39 +109,174 @@ _SPHINX_CONTROL_METADATA = frozenset(
     {"nocomments", "no-search", "nosearch", "orphan", "tocdepth"}
 )
 
-
-@beartype
-def _get_text_color_mapping() -> dict[str, Color]:
-    """Get the mapping from CSS classes to Notion colors."""
-    return {
-        "text-red": Color.RED,
-        "text-blue": Color.BLUE,
-        "text-green": Color.GREEN,
-        "text-yellow": Color.YELLOW,
-        "text-orange": Color.ORANGE,
-        "text-purple": Color.PURPLE,
-        "text-pink": Color.PINK,
-        "text-brown": Color.BROWN,
-        "text-gray": Color.GRAY,
-        "text-grey": Color.GRAY,
+_TEXT_COLOR_MAPPING: dict[str, Color] = {
+    "text-red": Color.RED,
+    "text-blue": Color.BLUE,
+    "text-green": Color.GREEN,
+    "text-yellow": Color.YELLOW,
+    "text-orange": Color.ORANGE,
+    "text-purple": Color.PURPLE,
+    "text-pink": Color.PINK,
+    "text-brown": Color.BROWN,
+    "text-gray": Color.GRAY,
+    "text-grey": Color.GRAY,
+}
+
+_BACKGROUND_COLOR_MAPPING: dict[str, BGColor] = {
+    "bg-red": BGColor.RED,
+    "bg-blue": BGColor.BLUE,
+    "bg-green": BGColor.GREEN,
+    "bg-yellow": BGColor.YELLOW,
+    "bg-orange": BGColor.ORANGE,
+    "bg-purple": BGColor.PURPLE,
+    "bg-pink": BGColor.PINK,
+    "bg-brown": BGColor.BROWN,
+    "bg-gray": BGColor.GRAY,
+    "bg-grey": BGColor.GRAY,
+}
+
+_SUPPORTED_STYLE_CLASSES = frozenset(
+    {
+        "text-bold",
+        "text-italic",
+        "text-mono",
+        "text-strike",
+        "text-underline",
+        "kbd",
+        "file",
+        *_TEXT_COLOR_MAPPING,
+        *_BACKGROUND_COLOR_MAPPING,
     }
+)
 
-
-@beartype
-def _get_background_color_classes() -> set[str]:
-    """Get the set of supported background color classes."""
-    return {
-        "bg-red",
-        "bg-blue",
-        "bg-green",
-        "bg-yellow",
-        "bg-orange",
-        "bg-purple",
-        "bg-pink",
-        "bg-brown",
-        "bg-gray",
-        "bg-grey",
+# Semantic classes that don't affect Notion styling. Cross-reference
+# styling comes from literal nodes, while version status is already
+# represented by generated text and the containing callout.
+_IGNORED_STYLE_CLASSES = frozenset(
+    {
+        "added",
+        "changed",
+        "deprecated",
+        "xref",
+        "py",
+        "py-obj",
+        "download",
+        "std",
+        "std-confval",
+        "std-envvar",
+        "std-keyword",
+        "std-numref",
+        "std-option",
+        "std-term",
+        "std-token",
+        "versionmodified",
     }
+)
+
+_CODE_LANGUAGE_MAPPING: dict[str, CodeLang] = {
+    "abap": CodeLang.ABAP,
+    "arduino": CodeLang.ARDUINO,
+    "bash": CodeLang.BASH,
+    "basic": CodeLang.BASIC,
+    "c": CodeLang.C,
+    "clojure": CodeLang.CLOJURE,
+    "coffeescript": CodeLang.COFFEESCRIPT,
+    "console": CodeLang.SHELL,
+    "cpp": CodeLang.CPP,
+    "c++": CodeLang.CPP,
+    "csharp": CodeLang.CSHARP,
+    "c#": CodeLang.CSHARP,
+    "css": CodeLang.CSS,
+    "dart": CodeLang.DART,
+    "default": CodeLang.PLAIN_TEXT,
+    "diff": CodeLang.DIFF,
+    "docker": CodeLang.DOCKER,
+    "dockerfile": CodeLang.DOCKER,
+    "elixir": CodeLang.ELIXIR,
+    "elm": CodeLang.ELM,
+    "erlang": CodeLang.ERLANG,
+    "flow": CodeLang.FLOW,
+    "fortran": CodeLang.FORTRAN,
+    "fsharp": CodeLang.FSHARP,
+    "f#": CodeLang.FSHARP,
+    "gherkin": CodeLang.GHERKIN,
+    "glsl": CodeLang.GLSL,
+    "go": CodeLang.GO,
+    "graphql": CodeLang.GRAPHQL,
+    "groovy": CodeLang.GROOVY,
+    "haskell": CodeLang.HASKELL,
+    # This is not a perfect match, but at least JSON within the
+    # HTTP definition will be highlighted.
+    "http": CodeLang.JSON,
+    "html": CodeLang.HTML,
+    "java": CodeLang.JAVA,
+    "javascript": CodeLang.JAVASCRIPT,
+    "js": CodeLang.JAVASCRIPT,
+    "json": CodeLang.JSON,
+    "julia": CodeLang.JULIA,
+    "kotlin": CodeLang.KOTLIN,
+    "latex": CodeLang.LATEX,
+    "tex": CodeLang.LATEX,
+    "less": CodeLang.LESS,
+    "lisp": CodeLang.LISP,
+    "livescript": CodeLang.LIVESCRIPT,
+    "lua": CodeLang.LUA,
+    "makefile": CodeLang.MAKEFILE,
+    "make": CodeLang.MAKEFILE,
+    "markdown": CodeLang.MARKDOWN,
+    "md": CodeLang.MARKDOWN,
+    "markup": CodeLang.MARKUP,
+    "matlab": CodeLang.MATLAB,
+    "mermaid": CodeLang.MERMAID,
+    "nix": CodeLang.NIX,
+    "objective-c": CodeLang.OBJECTIVE_C,
+    "objc": CodeLang.OBJECTIVE_C,
+    "ocaml": CodeLang.OCAML,
+    "pascal": CodeLang.PASCAL,
+    "perl": CodeLang.PERL,
+    "php": CodeLang.PHP,
+    "powershell": CodeLang.POWERSHELL,
+    "ps1": CodeLang.POWERSHELL,
+    "prolog": CodeLang.PROLOG,
+    "protobuf": CodeLang.PROTOBUF,
+    "python": CodeLang.PYTHON,
+    "py": CodeLang.PYTHON,
+    "r": CodeLang.R,
+    "reason": CodeLang.REASON,
+    "ruby": CodeLang.RUBY,
+    "rb": CodeLang.RUBY,
+    # This is not a perfect match, but at least rest-example will
+    # be rendered.
+    "rest": CodeLang.PLAIN_TEXT,
+    "rust": CodeLang.RUST,
+    "rs": CodeLang.RUST,
+    "sass": CodeLang.SASS,
+    "scala": CodeLang.SCALA,
+    "scheme": CodeLang.SCHEME,
+    "scss": CodeLang.SCSS,
+    "shell": CodeLang.SHELL,
+    "sh": CodeLang.SHELL,
+    "sql": CodeLang.SQL,
+    "swift": CodeLang.SWIFT,
+    "text": CodeLang.PLAIN_TEXT,
+    "toml": CodeLang.TOML,
+    "typescript": CodeLang.TYPESCRIPT,
+    "ts": CodeLang.TYPESCRIPT,
+    # This is not a perfect match, but it's the best we can do.
+    "tsx": CodeLang.TYPESCRIPT,
+    "udiff": CodeLang.DIFF,
+    "vb.net": CodeLang.VB_NET,
+    "vbnet": CodeLang.VB_NET,
+    "verilog": CodeLang.VERILOG,
+    "vhdl": CodeLang.VHDL,
+    "visual basic": CodeLang.VISUAL_BASIC,
+    "vb": CodeLang.VISUAL_BASIC,
+    "webassembly": CodeLang.WEBASSEMBLY,
+    "wasm": CodeLang.WEBASSEMBLY,
+    "xml": CodeLang.XML,
+    "yaml": CodeLang.YAML,
+    "yml": CodeLang.YAML,
+}
 
 
 @beartype
@@ -150,11 +285,9 @@ def _color_from_css_classes(*, classes: Sequence[str]) -> Color | None:
 
     Classes created by ``sphinxcontrib-text-styles``.
     """
-    color_mapping = _get_text_color_mapping()
-
     for css_class in classes:
-        if css_class in color_mapping:
-            return color_mapping[css_class]
+        if css_class in _TEXT_COLOR_MAPPING:
+            return _TEXT_COLOR_MAPPING[css_class]
 
     return None
 
@@ -167,22 +300,9 @@ def _background_color_from_css_classes(
 
     Classes created by ``sphinxcontrib-text-styles``.
     """
-    bg_color_mapping: dict[str, BGColor] = {
-        "bg-red": BGColor.RED,
-        "bg-blue": BGColor.BLUE,
-        "bg-green": BGColor.GREEN,
-        "bg-yellow": BGColor.YELLOW,
-        "bg-orange": BGColor.ORANGE,
-        "bg-purple": BGColor.PURPLE,
-        "bg-pink": BGColor.PINK,
-        "bg-brown": BGColor.BROWN,
-        "bg-gray": BGColor.GRAY,
-        "bg-grey": BGColor.GRAY,
-    }
-
     for css_class in classes:
-        if css_class in bg_color_mapping:
-            return bg_color_mapping[css_class]
+        if css_class in _BACKGROUND_COLOR_MAPPING:
+            return _BACKGROUND_COLOR_MAPPING[css_class]
 
     return None
 
@@ -650,9 +770,6 @@ def _create_styled_text_from_node(*, node: nodes.Element) -> Text:
     bg_color = _background_color_from_css_classes(classes=classes)
     text_color = _color_from_css_classes(classes=classes)
 
-    color_mapping = _get_text_color_mapping()
-    bg_color_classes = _get_background_color_classes()
-
     is_bold = isinstance(node, nodes.strong) or "text-bold" in classes
     is_italic = isinstance(node, nodes.emphasis) or "text-italic" in classes
     is_code = (
@@ -666,43 +783,11 @@ def _create_styled_text_from_node(*, node: nodes.Element) -> Text:
     )
     is_underline = "text-underline" in classes
 
-    supported_style_classes = {
-        "text-bold",
-        "text-italic",
-        "text-mono",
-        "text-strike",
-        "text-underline",
-        "kbd",
-        "file",
-        *color_mapping.keys(),
-        *bg_color_classes,
-    }
-    # Semantic classes that don't affect Notion styling. Cross-reference
-    # styling comes from literal nodes, while version status is already
-    # represented by generated text and the containing callout.
-    ignored_style_classes = {
-        "added",
-        "changed",
-        "deprecated",
-        "xref",
-        "py",
-        "py-obj",
-        "download",
-        "std",
-        "std-confval",
-        "std-envvar",
-        "std-keyword",
-        "std-numref",
-        "std-option",
-        "std-term",
-        "std-token",
-        "versionmodified",
-    }
     unsupported_styles = [
         css_class
         for css_class in classes
-        if css_class not in supported_style_classes
-        and css_class not in ignored_style_classes
+        if css_class not in _SUPPORTED_STYLE_CLASSES
+        and css_class not in _IGNORED_STYLE_CLASSES
     ]
 
     if unsupported_styles:
@@ -861,114 +946,9 @@ def _get_code_language(*, node: nodes.literal_block) -> CodeLang:
     to match Sphinx's HTML builder behavior.
     """
     pygments_lang: str = node.get(key="language", failobj="")
-    language_mapping: dict[str, CodeLang] = {
-        "abap": CodeLang.ABAP,
-        "arduino": CodeLang.ARDUINO,
-        "bash": CodeLang.BASH,
-        "basic": CodeLang.BASIC,
-        "c": CodeLang.C,
-        "clojure": CodeLang.CLOJURE,
-        "coffeescript": CodeLang.COFFEESCRIPT,
-        "console": CodeLang.SHELL,
-        "cpp": CodeLang.CPP,
-        "c++": CodeLang.CPP,
-        "csharp": CodeLang.CSHARP,
-        "c#": CodeLang.CSHARP,
-        "css": CodeLang.CSS,
-        "dart": CodeLang.DART,
-        "default": CodeLang.PLAIN_TEXT,
-        "diff": CodeLang.DIFF,
-        "docker": CodeLang.DOCKER,
-        "dockerfile": CodeLang.DOCKER,
-        "elixir": CodeLang.ELIXIR,
-        "elm": CodeLang.ELM,
-        "erlang": CodeLang.ERLANG,
-        "flow": CodeLang.FLOW,
-        "fortran": CodeLang.FORTRAN,
-        "fsharp": CodeLang.FSHARP,
-        "f#": CodeLang.FSHARP,
-        "gherkin": CodeLang.GHERKIN,
-        "glsl": CodeLang.GLSL,
-        "go": CodeLang.GO,
-        "graphql": CodeLang.GRAPHQL,
-        "groovy": CodeLang.GROOVY,
-        "haskell": CodeLang.HASKELL,
-        # This is not a perfect match, but at least JSON within the
-        # HTTP definition will be highlighted.
-        "http": CodeLang.JSON,
-        "html": CodeLang.HTML,
-        "java": CodeLang.JAVA,
-        "javascript": CodeLang.JAVASCRIPT,
-        "js": CodeLang.JAVASCRIPT,
-        "json": CodeLang.JSON,
-        "julia": CodeLang.JULIA,
-        "kotlin": CodeLang.KOTLIN,
-        "latex": CodeLang.LATEX,
-        "tex": CodeLang.LATEX,
-        "less": CodeLang.LESS,
-        "lisp": CodeLang.LISP,
-        "livescript": CodeLang.LIVESCRIPT,
-        "lua": CodeLang.LUA,
-        "makefile": CodeLang.MAKEFILE,
-        "make": CodeLang.MAKEFILE,
-        "markdown": CodeLang.MARKDOWN,
-        "md": CodeLang.MARKDOWN,
-        "markup": CodeLang.MARKUP,
-        "matlab": CodeLang.MATLAB,
-        "mermaid": CodeLang.MERMAID,
-        "nix": CodeLang.NIX,
-        "objective-c": CodeLang.OBJECTIVE_C,
-        "objc": CodeLang.OBJECTIVE_C,
-        "ocaml": CodeLang.OCAML,
-        "pascal": CodeLang.PASCAL,
-        "perl": CodeLang.PERL,
-        "php": CodeLang.PHP,
-        "powershell": CodeLang.POWERSHELL,
-        "ps1": CodeLang.POWERSHELL,
-        "prolog": CodeLang.PROLOG,
-        "protobuf": CodeLang.PROTOBUF,
-        "python": CodeLang.PYTHON,
-        "py": CodeLang.PYTHON,
-        "r": CodeLang.R,
-        "reason": CodeLang.REASON,
-        "ruby": CodeLang.RUBY,
-        "rb": CodeLang.RUBY,
-        # This is not a perfect match, but at least rest-example will
-        # be rendered.
-        "rest": CodeLang.PLAIN_TEXT,
-        "rust": CodeLang.RUST,
-        "rs": CodeLang.RUST,
-        "sass": CodeLang.SASS,
-        "scala": CodeLang.SCALA,
-        "scheme": CodeLang.SCHEME,
-        "scss": CodeLang.SCSS,
-        "shell": CodeLang.SHELL,
-        "sh": CodeLang.SHELL,
-        "sql": CodeLang.SQL,
-        "swift": CodeLang.SWIFT,
-        "text": CodeLang.PLAIN_TEXT,
-        "toml": CodeLang.TOML,
-        "typescript": CodeLang.TYPESCRIPT,
-        "ts": CodeLang.TYPESCRIPT,
-        # This is not a perfect match, but it's the best we can do.
-        "tsx": CodeLang.TYPESCRIPT,
-        "udiff": CodeLang.DIFF,
-        "vb.net": CodeLang.VB_NET,
-        "vbnet": CodeLang.VB_NET,
-        "verilog": CodeLang.VERILOG,
-        "vhdl": CodeLang.VHDL,
-        "visual basic": CodeLang.VISUAL_BASIC,
-        "vb": CodeLang.VISUAL_BASIC,
-        "webassembly": CodeLang.WEBASSEMBLY,
-        "wasm": CodeLang.WEBASSEMBLY,
-        "xml": CodeLang.XML,
-        "yaml": CodeLang.YAML,
-        "yml": CodeLang.YAML,
-    }
-
     lang_lower = pygments_lang.lower()
-    if lang_lower in language_mapping:
-        return language_mapping[lang_lower]
+    if lang_lower in _CODE_LANGUAGE_MAPPING:
+        return _CODE_LANGUAGE_MAPPING[lang_lower]
 
     _LOGGER.warning(
         "Unknown Notion code block language '%s'. Falling back to plain text.",
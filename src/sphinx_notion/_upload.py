@@ -10,6 +10,7 @@ from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
 from functools import cache
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, BinaryIO
 from urllib.parse import urlparse
@@ -40,6 +41,10 @@ _HTTP_FORBIDDEN = 403
 # large HTML documents, so we cap the output to keep logs readable while
 # still including the diagnostic content (e.g. the Cloudflare Ray ID).
 _MAX_LOGGED_BODY_CHARS = 2000
+# Existing Notion files are all served from the same host, so reuse one
+# connection pool rather than paying a new TLS handshake per download.
+_HTTP_SESSION = requests.Session()
+_DOWNLOAD_CHUNK_BYTES = 1024 * 1024
 
 
 def _file_uri_to_path(*, uri: str) -> Path:  # pragma: no cover
@@ -54,6 +59,16 @@ def _file_uri_to_path(*, uri: str) -> Path:  # pragma: no cover
     return Path(url2pathname(urlparse(uri).path))  # noqa: KW001
 
 
+@beartype
+def _local_file_path(*, url: str) -> Path | None:
+    """Get the local path of a ``file://`` URL, or ``None`` for other
+    URLs.
+    """
+    if urlparse(url=url).scheme != "file":
+        return None
+    return _file_uri_to_path(uri=url)
+
+
 @beartype
 @dataclass(frozen=True, kw_only=True, slots=True)
 class _MatchLengths:
@@ -265,11 +280,8 @@ def _calculate_file_sha(
     file_path: Path,
 ) -> str:  # pragma: no cover - live file duplicate check
     """Calculate SHA-256 hash of a file."""
-    sha256_hash = hashlib.sha256()
     with file_path.open(mode="rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(chunk)
-    return sha256_hash.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 @beartype
@@ -280,9 +292,13 @@ def _calculate_file_sha_from_url(
 ) -> str:  # pragma: no cover - requires network file download
     """Calculate SHA-256 hash of a file from a URL."""
     sha256_hash = hashlib.sha256()
-    with requests.get(url=file_url, stream=True, timeout=10) as response:
+    with _HTTP_SESSION.get(
+        url=file_url,
+        stream=True,
+        timeout=10,
+    ) as response:
         response.raise_for_status()
-        for chunk in response.iter_content(chunk_size=4096):
+        for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_BYTES):
             if chunk:
                 sha256_hash.update(chunk)
     return sha256_hash.hexdigest()
@@ -321,24 +337,29 @@ def _find_matching_prefix_and_suffix_lengths(
     min_len = min(len(existing_blocks), len(local_blocks))
 
     prefix_len = 0
-    for i in range(min_len):
-        if _is_existing_equivalent(
-            existing_page_block=existing_blocks[i],
-            local_block=local_blocks[i],
+    for existing_block, local_block in zip(
+        existing_blocks,
+        local_blocks,
+        strict=False,
+    ):
+        if not _is_existing_equivalent(
+            existing_page_block=existing_block,
+            local_block=local_block,
         ):
-            prefix_len += 1
-        else:
             break
+        prefix_len += 1
 
     suffix_len = 0
-    for i in range(1, min_len - prefix_len + 1):
-        if _is_existing_equivalent(
-            existing_page_block=existing_blocks[-i],
-            local_block=local_blocks[-i],
+    for existing_block, local_block in islice(
+        zip(reversed(existing_blocks), reversed(local_blocks), strict=False),
+        min_len - prefix_len,
+    ):
+        if not _is_existing_equivalent(
+            existing_page_block=existing_block,
+            local_block=local_block,
         ):
-            suffix_len += 1
-        else:
             break
+        suffix_len += 1
 
     return _MatchLengths(prefix=prefix_len, suffix=suffix_len)
 
@@ -354,13 +375,12 @@ def _is_existing_equivalent(
         return False
 
     if isinstance(local_block, _FILE_BLOCK_TYPES):
-        parsed = urlparse(url=local_block.url)
-        if parsed.scheme == "file":  # pragma: no cover - local duplicate check
+        local_path = _local_file_path(url=local_block.url)
+        if local_path is not None:  # pragma: no cover - local duplicate check
             assert isinstance(existing_page_block, _FILE_BLOCK_TYPES)
-            local_file_path = _file_uri_to_path(uri=local_block.url)
             local_name: str | None
             if isinstance(local_block, UnoFile):
-                local_name = local_block.name or local_file_path.name
+                local_name = local_block.name or local_path.name
             else:
                 local_name = local_block.file_info.name
 
@@ -376,7 +396,7 @@ def _is_existing_equivalent(
 
             return _files_match(
                 existing_file_url=existing_page_block.file_info.url,
-                local_file_path=local_file_path,
+                local_file_path=local_path,
             )
     elif isinstance(existing_page_block, ParentBlock):
         assert isinstance(local_block, ParentBlock)
@@ -446,9 +466,8 @@ def _get_uploaded_cover(
 def _block_with_uploaded_file(*, block: Block, session: Session) -> Block:
     """Replace a file block with an uploaded file block."""
     if isinstance(block, _FILE_BLOCK_TYPES):
-        parsed = urlparse(url=block.url)
-        if parsed.scheme == "file":
-            file_path = _file_uri_to_path(uri=block.url)
+        file_path = _local_file_path(url=block.url)
+        if file_path is not None:
             _LOGGER.info("Uploading file '%s'", file_path.name)
 
             with file_path.open(mode="rb") as file_stream:
@@ -587,17 +606,17 @@ def _check_discussions(
     cancel_on_discussion: bool,
 ) -> None:
     """Cancel when deletions would discard discussions, if requested."""
-    blocks_with_discussions = [
-        block for block in blocks_to_delete if len(block.discussions) > 0
-    ]
-    if not cancel_on_discussion or not blocks_with_discussions:
+    if not cancel_on_discussion:
         return
 
-    total_discussions = sum(
-        len(block.discussions) for block in blocks_with_discussions
-    )
+    counts = [len(block.discussions) for block in blocks_to_delete]
+    discussion_counts = [count for count in counts if count > 0]
+    if not discussion_counts:
+        return
+
+    total_discussions = sum(discussion_counts)
     error_message = (
-        f"Page '{title}' has {len(blocks_with_discussions)} "
+        f"Page '{title}' has {len(discussion_counts)} "
         f"block(s) to delete with {total_discussions} discussion "
         "thread(s). Upload cancelled."
     )
@@ -327,6 +327,54 @@ def test_upload_deletes_and_replaces_changed_blocks(
     assert after_append_count == before_append_count + 1
 
 
+def test_upload_without_cancel_on_discussion_skips_discussions(
+    *,
+    respx_mock: respx.MockRouter,
+    notion_session: Session,
+    parent_page_id: str,
+) -> None:
+    """Discussions are not fetched unless cancelling on discussions."""
+    before_comments_count = count_mock_requests(
+        mock=respx_mock,
+        method="GET",
+        url_path="/v1/comments",
+    )
+    before_delete_count = count_mock_requests(
+        mock=respx_mock,
+        method="DELETE",
+        url_path="/v1/blocks/c02fc1d3-db8b-45c5-a222-27595b15aea7",
+    )
+    notion_upload.upload_to_notion(
+        session=notion_session,
+        blocks=[
+            UnoParagraph(text=text(text="Different content triggers sync"))
+        ],
+        page_id=None,
+        parent_page_id=parent_page_id,
+        parent_database_id=None,
+        title="Upload Title",
+        icon=None,
+        cover_path=None,
+        cover_url=None,
+        cancel_on_discussion=False,
+        strategy=UploadStrategy.DIFF,
+        allow_subpages=False,
+    )
+    after_comments_count = count_mock_requests(
+        mock=respx_mock,
+        method="GET",
+        url_path="/v1/comments",
+    )
+    after_delete_count = count_mock_requests(
+        mock=respx_mock,
+        method="DELETE",
+        url_path="/v1/blocks/c02fc1d3-db8b-45c5-a222-27595b15aea7",
+    )
+
+    assert after_delete_count == before_delete_count + 1
+    assert after_comments_count == before_comments_count
+
+
 def test_failed_file_upload_leaves_existing_blocks(
     *,
     respx_mock: respx.MockRouter,
@@ -1021,6 +1069,58 @@ def test_upload_local_file_uses_filename_when_name_is_missing(
     }
 
 
+def test_upload_several_local_files_keeps_order(
+    *,
+    notion_session: Session,
+    parent_page_id: str,
+    respx_mock: respx.MockRouter,
+    tmp_path: Path,
+) -> None:
+    """Each local file is uploaded once and appended in document order.
+
+    The mock API answers every append with a single block, so the append
+    itself is patched out and its arguments are checked instead.
+    """
+    file_names = ["first.zip", "second.zip", "third.zip"]
+    local_files = [tmp_path / file_name for file_name in file_names]
+    for local_file in local_files:
+        local_file.write_bytes(data=local_file.name.encode())
+    uploads_before = _file_upload_create_count(mock=respx_mock)
+
+    with patch.object(
+        target=notion_upload,
+        attribute="_append_blocks",
+    ) as append_blocks_mock:
+        notion_upload.upload_to_notion(
+            session=notion_session,
+            blocks=[
+                UnoFile(file=ExternalFile(url=local_file.as_uri()))
+                for local_file in local_files
+            ],
+            page_id=None,
+            parent_page_id=parent_page_id,
+            parent_database_id=None,
+            title="Upload Title",
+            icon=None,
+            cover_path=None,
+            cover_url=None,
+            cancel_on_discussion=False,
+            strategy=UploadStrategy.DIFF,
+            allow_subpages=False,
+        )
+
+    assert _file_upload_create_count(mock=respx_mock) == (
+        uploads_before + len(file_names)
+    )
+    append_blocks_mock.assert_called_once()
+    appended_blocks = append_blocks_mock.call_args.kwargs["blocks"]
+    assert len(appended_blocks) == len(file_names)
+    appended_names = [
+        block.name for block in appended_blocks if isinstance(block, UnoFile)
+    ]
+    assert appended_names == file_names
+
+
 @pytest.mark.parametrize(
     argnames="local_name",
     argvalues=[
@@ -1051,7 +1151,7 @@ def test_upload_matching_local_file_is_unchanged(
     response.__enter__.return_value = response
     response.iter_content.return_value = [b"image-data"]
     with patch.object(
-        target=requests,
+        target=requests.Session,
         attribute="get",
         return_value=response,
     ):